@@ -0,0 +1,488 @@
+"""
+Fake GitHub API server
+----------------------
+A local, in-memory stand-in for the GitHub REST endpoints autogitrepo calls,
+so throughput can be measured without touching github.com.
+
+Latency, page size and secondary rate limits are configurable. Every response
+carries X-RateLimit-* headers and the server counts requests per route. Quota is
+kept per credential, as on github.com: every token (and every GitHub App
+installation token the server mints) has its own window. Organisations share
+the account's repository namespace.
+"""
+
+import base64, hashlib, json, re, threading, time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _sha(*parts):
+    return hashlib.sha1("\0".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+
+def _blob_sha(data):
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class fakeGitHub(object):
+    """
+    In-memory GitHub account served over HTTP on localhost.
+
+    Args:
+        latency (float): Seconds added to every response
+        max_per_page (int): Largest page size honoured by list endpoints
+        rate_limit_every (int): Answer every Nth write with a secondary rate limit (0 disables)
+        retry_after (int): Retry-After seconds sent with those responses
+        quota (int): Primary rate limit per credential and window
+        owner (str): Login of the authenticated user
+        window (int): Seconds until each credential's quota resets
+        token_ttl (int): Lifetime of the installation tokens minted for GitHub Apps
+    """
+    def __init__(self, latency=0.0, max_per_page=100, rate_limit_every=0, retry_after=1, quota=5000, owner="bench",
+                 window=3600, token_ttl=3600):
+        self.latency = latency
+        self.max_per_page = max_per_page
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.quota = quota
+        self.owner = owner
+        self.repos = {}
+        self.requests = Counter()
+        self.bytes_received = 0
+        self.writes = 0
+        self.window = window
+        self.token_ttl = token_ttl
+        self.credentials = {}    # token -> {"remaining", "reset_at", "writes", "requests"}
+        self.orgs = set()
+        self.installations = {}  # installation id -> account login
+        self.minted = Counter()  # installation id -> tokens minted
+        self._lock = threading.RLock()
+        self._server = None
+
+    # -- lifecycle --------------------------------------------------------
+
+    def start(self, port=0):
+        """Serve in a background thread and return the base URL."""
+        api = self
+
+        class Handler(_handler):
+            pass
+        Handler.api = api
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def total_requests(self):
+        return sum(self.requests.values())
+
+    def add_repos(self, count, prefix="existing"):
+        """Pre-populate the account, e.g. to benchmark listing."""
+        for i in range(count):
+            self._new_repo(f"{prefix}-{i}", "")
+
+    def add_org(self, login):
+        """Add an organisation the authenticated user may create repositories in."""
+        self.orgs.add(login)
+
+    def add_installation(self, installation_id, account):
+        """Install a GitHub App on `account` (an organisation) under `installation_id`."""
+        self.add_org(account)
+        self.installations[int(installation_id)] = account
+
+    def credential(self, token):
+        """Quota state of one credential, refilled once its window has passed."""
+        with self._lock:
+            state = self.credentials.get(token)
+            if state is None or state["reset_at"] <= time.time():
+                state = self.credentials[token] = {"remaining": self.quota, "reset_at": int(time.time()) + self.window,
+                                                   "writes": 0, "requests": 0}
+            return state
+
+    def add_template(self, name, files):
+        """Add a template repository holding `files` (path -> str/bytes) on main."""
+        repo = self._new_repo(name, "Template")
+        repo["is_template"] = True
+        for path, content in files.items():
+            content = content.encode("utf-8") if isinstance(content, str) else content
+            repo["files"][path] = (_blob_sha(content), content)
+        repo["refs"]["main"] = self._commit(repo, "Scaffold", _sha("tree", sorted(repo["files"])), [])["sha"]
+        return repo
+
+    # -- model ------------------------------------------------------------
+
+    def _new_repo(self, name, description, private=False, owner=None):
+        repo = {
+            "name": name, "description": description, "private": private, "updated_at": _now(),
+            "owner": owner or self.owner,
+            "files": {}, "commits": {}, "refs": {}, "pulls": [],
+            "collaborators": {}, "protection": {},
+        }
+        self.repos[name.lower()] = repo
+        return repo
+
+    def repo_json(self, repo):
+        full_name = f"{repo['owner']}/{repo['name']}"
+        return {
+            "id": int(_sha(full_name)[:8], 16), "name": repo["name"], "full_name": full_name,
+            "owner": {"login": repo["owner"], "type": "Organization" if repo["owner"] in self.orgs else "User"},
+            "private": repo["private"], "description": repo["description"],
+            "html_url": f"https://github.local/{full_name}",
+            "url": f"{self.base_url}/repos/{full_name}",
+            "default_branch": "main", "updated_at": repo["updated_at"],
+        }
+
+    def _commit(self, repo, message, tree_sha, parents):
+        sha = _sha("commit", repo["name"], message, tree_sha, *parents, time.time())
+        commit = {"sha": sha, "message": message, "tree": {"sha": tree_sha, "url": ""},
+                  "parents": [{"sha": parent} for parent in parents],
+                  "url": f"{self.base_url}/repos/{repo['owner']}/{repo['name']}/git/commits/{sha}"}
+        repo["commits"][sha] = commit
+        return commit
+
+    def _ref_json(self, repo, branch):
+        return {"ref": f"refs/heads/{branch}",
+                "url": f"{self.base_url}/repos/{repo['owner']}/{repo['name']}/git/refs/heads/{branch}",
+                "object": {"sha": repo["refs"][branch], "type": "commit", "url": ""}}
+
+
+class _handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like api.github.com
+    api = None
+
+    ROUTES = [
+        ("GET", r"/user", "get_user"),
+        ("GET", r"/rate_limit", "get_rate_limit"),
+        ("GET", r"/user/repos", "list_repos"),
+        ("POST", r"/user/repos", "create_repo"),
+        ("GET", r"/orgs/(?P<org>[^/]+)", "get_org"),
+        ("GET", r"/orgs/(?P<org>[^/]+)/repos", "list_repos"),
+        ("POST", r"/orgs/(?P<org>[^/]+)/repos", "create_repo"),
+        ("GET", r"/app/installations", "list_installations"),
+        ("GET", r"/app/installations/(?P<installation>\d+)", "get_installation"),
+        ("POST", r"/app/installations/(?P<installation>\d+)/access_tokens", "create_access_token"),
+        ("GET", r"/repos/[^/]+/(?P<repo>[^/]+)", "get_repo"),
+        ("POST", r"/repos/[^/]+/(?P<repo>[^/]+)/generate", "generate_repo"),
+        ("GET", r"/repos/[^/]+/(?P<repo>[^/]+)/contents/(?P<path>.+)", "get_contents"),
+        ("PUT", r"/repos/[^/]+/(?P<repo>[^/]+)/contents/(?P<path>.+)", "put_contents"),
+        ("GET", r"/repos/[^/]+/(?P<repo>[^/]+)/git/refs?/heads/(?P<branch>.+)", "get_ref"),
+        ("POST", r"/repos/[^/]+/(?P<repo>[^/]+)/git/refs", "create_ref"),
+        ("PATCH", r"/repos/[^/]+/(?P<repo>[^/]+)/git/refs/heads/(?P<branch>.+)", "update_ref"),
+        ("GET", r"/repos/[^/]+/(?P<repo>[^/]+)/git/commits/(?P<sha>[0-9a-f]+)", "get_commit"),
+        ("POST", r"/repos/[^/]+/(?P<repo>[^/]+)/git/commits", "create_commit"),
+        ("POST", r"/repos/[^/]+/(?P<repo>[^/]+)/git/trees", "create_tree"),
+        ("POST", r"/repos/[^/]+/(?P<repo>[^/]+)/git/blobs", "create_blob"),
+        ("POST", r"/repos/[^/]+/(?P<repo>[^/]+)/pulls", "create_pull"),
+        ("PUT", r"/repos/[^/]+/(?P<repo>[^/]+)/collaborators/(?P<user>[^/]+)", "add_collaborator"),
+        ("GET", r"/repos/[^/]+/(?P<repo>[^/]+)/branches/(?P<branch>[^/]+)", "get_branch"),
+        ("PUT", r"/repos/[^/]+/(?P<repo>[^/]+)/branches/(?P<branch>[^/]+)/protection", "set_protection"),
+        ("POST", r"/graphql", "graphql"),
+    ]
+    # Only the aliased repository lookups issued by githubManipulations.batch_inspect
+    GRAPHQL_REPOSITORY = re.compile(r"(\w+): repository\(owner: \$owner, name: \$(\w+)\)")
+    COMPILED = [(verb, re.compile(pattern + r"/?$"), name) for verb, pattern, name in ROUTES]
+
+    def log_message(self, *args):
+        pass  # keep benchmark output clean
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def _dispatch(self, verb):
+        api = self.api
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        body = json.loads(raw) if raw else {}
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        for route_verb, pattern, name in self.COMPILED:
+            match = pattern.match(url.path)
+            if route_verb == verb and match:
+                break
+        else:
+            return self._send(404, {"message": "Not Found"})
+        if self._token().startswith("ghs_") and (url.path == "/user" or url.path.startswith("/user/")):
+            # Installation tokens act for the App, not for a user
+            return self._send(403, {"message": "Resource not accessible by integration"})
+
+        if api.latency:
+            time.sleep(api.latency)
+        quota = api.credential(self._token())
+        with api._lock:
+            api.requests[f"{verb} {name}"] += 1
+            api.bytes_received += len(raw)
+            quota["requests"] += 1
+            if quota["remaining"] == 0 and name != "get_rate_limit":
+                return self._send(403, {"message": "API rate limit exceeded for user."})
+            if verb != "GET":
+                api.writes += 1
+                quota["writes"] += 1
+                if api.rate_limit_every and quota["writes"] % api.rate_limit_every == 0:
+                    return self._send(403, {"message": "You have exceeded a secondary rate limit."},
+                                      {"Retry-After": str(api.retry_after)})
+            try:
+                status, payload, headers = getattr(self, name)(body, query, **{
+                    key: unquote(value) for key, value in match.groupdict().items()})
+            except KeyError:
+                status, payload, headers = 404, {"message": "Not Found"}, {}
+        self._send(status, payload, headers)
+
+    def _token(self):
+        # Every App JWT differs, so the App itself counts as one credential
+        scheme, _, token = (self.headers.get("Authorization") or "").partition(" ")
+        return "app" if scheme.lower() == "bearer" else token
+
+    def _send(self, status, payload, headers=None):
+        api = self.api
+        quota = api.credential(self._token())
+        data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        etag = '"%s"' % hashlib.md5(data).hexdigest()
+        if status == 200 and self.command == "GET" and self.headers.get("If-None-Match") == etag:
+            status, data = 304, b""   # 304s do not count against the quota
+        elif status < 400 or status == 403:
+            with api._lock:
+                quota["remaining"] = max(0, quota["remaining"] - 1)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Limit", str(api.quota))
+        self.send_header("X-RateLimit-Remaining", str(quota["remaining"]))
+        self.send_header("X-RateLimit-Reset", str(quota["reset_at"]))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _repo(self, name):
+        return self.api.repos[name.lower()]
+
+    # -- endpoints --------------------------------------------------------
+
+    def get_user(self, body, query):
+        return 200, {"login": self.api.owner, "type": "User",
+                     "url": f"{self.api.base_url}/user"}, {}
+
+    def get_org(self, body, query, org):
+        if org not in self.api.orgs:
+            raise KeyError(org)
+        return 200, {"login": org, "type": "Organization", "url": f"{self.api.base_url}/orgs/{org}"}, {}
+
+    def list_installations(self, body, query):
+        return 200, [self.get_installation(body, query, installation)[1] for installation in self.api.installations], {}
+
+    def get_installation(self, body, query, installation):
+        account = self.api.installations[int(installation)]
+        return 200, {"id": int(installation), "app_id": 1, "target_type": "Organization",
+                     "account": {"login": account, "type": "Organization"},
+                     "access_tokens_url": f"{self.api.base_url}/app/installations/{installation}/access_tokens"}, {}
+
+    def create_access_token(self, body, query, installation):
+        api = self.api
+        account = api.installations[int(installation)]
+        api.minted[int(installation)] += 1
+        expires = datetime.fromtimestamp(time.time() + api.token_ttl, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return 201, {"token": f"ghs_{installation}_{api.minted[int(installation)]}", "expires_at": expires,
+                     "permissions": {"administration": "write", "contents": "write"},
+                     "repository_selection": "all", "account": account}, {}
+
+    def get_rate_limit(self, body, query):
+        quota = self.api.credential(self._token())
+        core = {"limit": self.api.quota, "remaining": quota["remaining"], "reset": quota["reset_at"], "used": 0}
+        return 200, {"resources": {"core": core, "search": core, "graphql": core}, "rate": core}, {}
+
+    def list_repos(self, body, query, org=None):
+        api = self.api
+        per_page = min(int(query.get("per_page", 30)), api.max_per_page)
+        page = int(query.get("page", 1))
+        owner = org or api.owner
+        repos = sorted((repo for repo in api.repos.values() if repo["owner"] == owner),
+                       key=lambda repo: repo["updated_at"], reverse=True)
+        if "since" in query:
+            repos = [repo for repo in repos if repo["updated_at"] >= query["since"]]
+        if "visibility" in query and query["visibility"] != "all":
+            private = query["visibility"] == "private"
+            repos = [repo for repo in repos if repo["private"] == private]
+        last = max(1, -(-len(repos) // per_page))
+        items = [api.repo_json(repo) for repo in repos[(page - 1) * per_page:page * per_page]]
+        links = []
+        base = f"{api.base_url}{urlparse(self.path).path}?" + "&".join(
+            f"{key}={value}" for key, value in query.items() if key != "page")
+        if page < last:
+            links.append(f'<{base}&page={page + 1}>; rel="next"')
+            links.append(f'<{base}&page={last}>; rel="last"')
+        return 200, items, ({"Link": ", ".join(links)} if links else {})
+
+    def create_repo(self, body, query, org=None):
+        api = self.api
+        if org is not None and org not in api.orgs:
+            raise KeyError(org)
+        name = re.sub(r"[^A-Za-z0-9._-]+", "-", body["name"].strip())
+        if name.lower() in api.repos:
+            return 422, {"message": "Repository creation failed.", "errors": [
+                {"resource": "Repository", "code": "custom", "field": "name",
+                 "message": "name already exists on this account"}]}, {}
+        repo = api._new_repo(name, body.get("description", ""), body.get("private", False), owner=org)
+        return 201, api.repo_json(repo), {}
+
+    def get_repo(self, body, query, repo):
+        return 200, self.api.repo_json(self._repo(repo)), {}
+
+    def generate_repo(self, body, query, repo):
+        api = self.api
+        template = self._repo(repo)
+        if not template.get("is_template"):
+            return 422, {"message": f"{template['name']} is not a template repository"}, {}
+        name = re.sub(r"[^A-Za-z0-9._-]+", "-", body["name"].strip())
+        if name.lower() in api.repos:
+            return 422, {"message": "Unprocessable Entity", "errors": ["Name already exists on this account"]}, {}
+        created = api._new_repo(name, body.get("description", ""), body.get("private", False), owner=body.get("owner"))
+        created["files"] = dict(template["files"])
+        created["refs"]["main"] = api._commit(created, "Initial commit", _sha("tree", sorted(created["files"])),
+                                              [])["sha"]
+        return 201, api.repo_json(created), {}
+
+    def get_contents(self, body, query, repo, path):
+        repo = self._repo(repo)
+        sha, content = repo["files"][path]
+        return 200, {"type": "file", "name": path.rsplit("/", 1)[-1], "path": path, "sha": sha,
+                     "encoding": "base64", "content": base64.b64encode(content).decode("ascii"),
+                     "size": len(content)}, {}
+
+    def put_contents(self, body, query, repo, path):
+        api = self.api
+        repo = self._repo(repo)
+        content = base64.b64decode(body["content"])
+        if path in repo["files"] and body.get("sha") != repo["files"][path][0]:
+            return 409, {"message": f"{path} does not match {body.get('sha')}"}, {}
+        sha = _blob_sha(content)
+        repo["files"][path] = (sha, content)
+        branch = body.get("branch", "main")
+        parents = [repo["refs"][branch]] if branch in repo["refs"] else []
+        commit = api._commit(repo, body["message"], _sha("tree", sorted(repo["files"])), parents)
+        repo["refs"][branch] = commit["sha"]
+        repo["updated_at"] = _now()
+        return (200 if parents else 201), {"content": {"path": path, "sha": sha, "type": "file"},
+                                           "commit": commit}, {}
+
+    def get_ref(self, body, query, repo, branch):
+        repo = self._repo(repo)
+        if not repo["refs"]:
+            return 409, {"message": "Git Repository is empty."}, {}
+        return 200, self.api._ref_json(repo, branch), {}
+
+    def create_ref(self, body, query, repo):
+        repo = self._repo(repo)
+        branch = body["ref"].replace("refs/heads/", "", 1)
+        repo["refs"][branch] = body["sha"]
+        return 201, self.api._ref_json(repo, branch), {}
+
+    def update_ref(self, body, query, repo, branch):
+        repo = self._repo(repo)
+        repo["refs"][branch] = body["sha"]
+        return 200, self.api._ref_json(repo, branch), {}
+
+    def get_commit(self, body, query, repo, sha):
+        return 200, self._repo(repo)["commits"][sha], {}
+
+    def create_commit(self, body, query, repo):
+        repo = self._repo(repo)
+        return 201, self.api._commit(repo, body["message"], body["tree"], body.get("parents", [])), {}
+
+    def create_tree(self, body, query, repo):
+        repo = self._repo(repo)
+        for entry in body["tree"]:
+            if "content" in entry:
+                content = entry["content"].encode("utf-8")
+                repo["files"][entry["path"]] = (_blob_sha(content), content)
+        return 201, {"sha": _sha("tree", json.dumps(body, sort_keys=True)), "tree": [], "url": ""}, {}
+
+    def create_blob(self, body, query, repo):
+        data = body["content"].encode("utf-8")
+        if body.get("encoding") == "base64":
+            data = base64.b64decode(data)
+        return 201, {"sha": _blob_sha(data), "url": ""}, {}
+
+    def create_pull(self, body, query, repo):
+        repo = self._repo(repo)
+        number = len(repo["pulls"]) + 1
+        repo["pulls"].append(body)
+        return 201, {"number": number, "title": body["title"],
+                     "html_url": f"https://github.local/{repo['owner']}/{repo['name']}/pull/{number}"}, {}
+
+    def add_collaborator(self, body, query, repo, user):
+        self._repo(repo)["collaborators"][user] = body.get("permission", "push")
+        return 204, None, {}
+
+    def get_branch(self, body, query, repo, branch):
+        repo = self._repo(repo)
+        url = f"{self.api.base_url}/repos/{repo['owner']}/{repo['name']}/branches/{branch}"
+        return 200, {"name": branch, "commit": {"sha": repo["refs"].get(branch)},
+                     "protected": branch in repo["protection"], "protection_url": f"{url}/protection",
+                     "url": url}, {}
+
+    def graphql(self, body, query):
+        api = self.api
+        variables = body.get("variables", {})
+        data, errors = {}, []
+        for alias, variable in self.GRAPHQL_REPOSITORY.findall(body["query"]):
+            repo = api.repos.get(variables[variable].lower())
+            if repo is None:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias],
+                               "message": f"Could not resolve to a Repository with the name '{variables[variable]}'."})
+                continue
+            readme = repo["files"].get("README.md")
+            data[alias] = {"name": repo["name"], "url": f"https://github.local/{repo['owner']}/{repo['name']}",
+                           "description": repo["description"],
+                           "defaultBranchRef": {"name": "main"} if repo["refs"] else None,
+                           "readme": {"oid": readme[0]} if readme else None}
+        payload = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        return 200, payload, {}
+
+    def set_protection(self, body, query, repo, branch):
+        self._repo(repo)["protection"][branch] = body
+        # GitHub answers with its own shape, booleans wrapped as {"enabled": ...}
+        return 200, {"enforce_admins": {"enabled": bool(body.get("enforce_admins"))},
+                     "required_pull_request_reviews": body.get("required_pull_request_reviews")}, {}
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve a fake GitHub API on localhost.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    args = parser.parse_args()
+    server = fakeGitHub(latency=args.latency, rate_limit_every=args.rate_limit_every)
+    print(f"Fake GitHub API on {server.start(args.port)}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
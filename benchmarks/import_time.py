@@ -0,0 +1,73 @@
+"""
+Cold-start benchmark
+--------------------
+Times fresh interpreter runs of the commands a cron job pays for before doing
+any work, and fails when the median exceeds the budget:
+
+- `import logic`
+- `python main.py --help`
+- `python main.py render --help`
+
+It also checks that importing `logic` leaves pandas and PyGithub unimported.
+
+Usage:
+    python benchmarks/import_time.py                  # 10 runs each, 0.25 s budget
+    python benchmarks/import_time.py --runs 20 --budget 0.15
+"""
+
+import argparse, os, statistics, subprocess, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "import logic": [sys.executable, "-c", "import logic"],
+    "main.py --help": [sys.executable, "main.py", "--help"],
+    "main.py render --help": [sys.executable, "main.py", "render", "--help"],
+}
+
+HEAVY = ("pandas", "numpy", "openpyxl", "github", "nacl", "cryptography")
+
+
+def time_command(command, runs):
+    """Median wall time of `runs` fresh runs of `command`."""
+    samples = []
+    for _ in range(runs):
+        began = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        samples.append(time.perf_counter() - began)
+    return statistics.median(samples)
+
+
+def heavy_imports():
+    """Heavy modules loaded as a side effect of `import logic`."""
+    probe = f"import sys, logic; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, check=True, capture_output=True, text=True)
+    return output.stdout.split()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check cold-start time against a budget.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=0.25, help="maximum median seconds per command")
+    args = parser.parse_args(argv)
+
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+    print(f"{'command':<24} {'median s':>9} {'over python s':>14}")
+    print(f"{'python -c pass':<24} {baseline:>9.3f} {'':>14}")
+    failed = []
+    for name, command in CASES.items():
+        seconds = time_command(command, args.runs)
+        print(f"{name:<24} {seconds:>9.3f} {seconds - baseline:>14.3f}")
+        if seconds > args.budget:
+            failed.append(f"{name} took {seconds:.3f}s (budget {args.budget}s)")
+
+    loaded = heavy_imports()
+    if loaded:
+        failed.append("import logic loaded " + ", ".join(loaded))
+    for message in failed:
+        print("FAIL:", message)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Listing benchmark
+-----------------
+Lists an account of N repositories on the local fake GitHub server twice:
+
+- serially through PyGithub's user.get_repos(), building a Repository per item
+- through repositoryLister, pages fetched in parallel and streamed to a sink
+
+and reports seconds, pages and peak traced memory of each.
+
+Usage:
+    python benchmarks/listing.py                      # 8000 repositories, 50 ms per response
+    python benchmarks/listing.py --repos 20000 --latency 0.1 --workers 16
+"""
+
+import argparse, os, sys, tempfile, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_github import fakeGitHub
+
+
+def measure(function):
+    """(seconds, peak traced MB, result) of one call."""
+    tracemalloc.start()
+    began = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - began
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return seconds, peak, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare serial and parallel repository listing.")
+    parser.add_argument("--repos", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every API response")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    server = fakeGitHub(latency=args.latency, quota=10 ** 6)
+    os.environ["GITHUB_API_URL"] = server.start()
+    os.environ["GITHUB_TOKEN"] = "bench-token"
+    server.add_repos(args.repos)
+    from logic import githubManipulations, jsonlSink
+    githubOPS = githubManipulations()
+    auth = githubOPS.authenticate_github(pool_size=args.workers, throttle=False)
+
+    def serial():
+        return sum(1 for _ in githubOPS.get_user(auth).get_repos())
+
+    def parallel(output):
+        with jsonlSink(output) as sink:
+            for item in githubOPS.iter_repositories(auth, workers=args.workers):
+                sink.write(item)
+        return sink.count
+
+    try:
+        print(f"{'method':<28} {'repos':>7} {'seconds':>8} {'peak MB':>8}")
+        requests = server.total_requests()
+        seconds, peak, count = measure(serial)
+        print(f"{'PyGithub get_repos':<28} {count:>7} {seconds:>8.2f} {peak:>8.1f}   "
+              f"{server.total_requests() - requests} requests")
+        with tempfile.TemporaryDirectory() as tmp:
+            requests = server.total_requests()
+            seconds, peak, count = measure(lambda: parallel(os.path.join(tmp, "repos.jsonl")))
+            print(f"{'repositoryLister -> JSONL':<28} {count:>7} {seconds:>8.2f} {peak:>8.1f}   "
+                  f"{server.total_requests() - requests} requests")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Provisioning benchmarks
+-----------------------
+Runs the main.py flow (read workbook, refresh the repository index, provision
+every row, write URLs back, list repositories) against the local fake GitHub
+server on synthetic workbooks, and reports:
+
+- repos/sec and HTTP calls per repo for provisioning
+- Excel read and write time, and the read time once the sheet cache is warm
+- peak RSS of the provisioning process
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # 10 and 1k rows
+    python benchmarks/run_benchmarks.py --rows 10 1000 100000 --provision-limit 500
+    python benchmarks/run_benchmarks.py --backend async --workers 32
+    python benchmarks/run_benchmarks.py --build-push     # offline build, one git push per repo
+    python benchmarks/run_benchmarks.py --template       # generate each repo from a template repository
+    python benchmarks/run_benchmarks.py --tokens 4 --quota 300 --window 5   # credential pool vs per-token quota
+"""
+
+import argparse, json, multiprocessing, os, queue, resource, sys, tempfile, time, traceback
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_github import fakeGitHub
+
+COLUMNS = [
+    "No.", "Assignment Title", "Objective", "Simulation Type", "Types of Dataset",
+    "Possible Sources for Dataset", "Dataset URLs", "Setup Instructions",
+    "Implementation Guide", "Expected Output(s)", "Background Studies",
+]
+
+# Scaffold of the template repository used with --template
+TEMPLATE_FILES = {
+    "README.md": "# Assignment\n",
+    ".gitignore": "__pycache__/\n*.py[cod]\n.env\nvenv/\n",
+    "requirements.txt": "flask\npandas\n",
+    "app.py": "from flask import Flask\n\napp = Flask(__name__)\n",
+    "tests/test_app.py": "def test_placeholder():\n    assert True\n",
+}
+
+
+def make_workbook(path, rows):
+    """Write a synthetic simulation workbook with `rows` rows."""
+    import pandas as pd
+    frame = pd.DataFrame({
+        "No.": range(1, rows + 1),
+        "Assignment Title": [f"Simulation Assignment {i}" for i in range(1, rows + 1)],
+        "Objective": ["Model and simulate a queueing system."] * rows,
+        "Simulation Type": ["Discrete-event"] * rows,
+        "Types of Dataset": ["Arrival times, Service times"] * rows,
+        "Possible Sources for Dataset": ["Kaggle\nUCI Repository"] * rows,
+        "Dataset URLs": ["https://example.com/a, https://example.com/b"] * rows,
+        "Setup Instructions": ["Create a virtualenv\nInstall requirements"] * rows,
+        "Implementation Guide": ["Load data\nBuild model\nRun simulation\nPlot results"] * rows,
+        "Expected Output(s)": ["Utilisation chart, Waiting time report"] * rows,
+        "Background Studies": ["Queue: A line of waiting entities\nServer: Resource serving entities"] * rows,
+    }, columns=COLUMNS)
+    frame.to_excel(path, index=False)
+    return path
+
+
+def _provision(workbook, base_url, provision_limit, workers, backend, build_push, template, tokens, results):
+    # Runs in a child process so peak RSS belongs to this size only; a failure is
+    # sent back as its traceback, so the parent never waits for a result that won't come
+    try:
+        results.put(_provision_run(workbook, base_url, provision_limit, workers, backend, build_push, template, tokens))
+    except BaseException:
+        results.put({"error": traceback.format_exc()})
+
+
+def _provision_run(workbook, base_url, provision_limit, workers, backend, build_push, template, tokens):
+    os.environ["GITHUB_TOKEN"] = "bench-token"
+    if tokens > 1:
+        os.environ["GITHUB_TOKENS"] = ",".join(f"bench-token-{i}" for i in range(tokens))
+    os.environ["GITHUB_API_URL"] = base_url
+    os.environ["XDG_CACHE_HOME"] = os.path.dirname(workbook)
+    sys.stdout = open(os.devnull, "w")   # the flow prints a line per repository
+    from logic import githubManipulations, stylesheetManipulations, provisioningEngine, repositoryIndex, runStateStore, \
+        localRepositoryBuilder
+
+    timings = {"excel_write": 0.0}
+    started = time.perf_counter()
+    sheetOPS = stylesheetManipulations(workbook)
+    rows = sheetOPS.tableRows()[:provision_limit]
+    timings["excel_read"] = time.perf_counter() - started
+    started = time.perf_counter()
+    stylesheetManipulations(workbook)   # unchanged workbook, answered by the sheet cache
+    timings["cached_read"] = time.perf_counter() - started
+
+    # Time the workbook rewrite wherever the journal triggers it
+    save = sheetOPS.saveToFile
+
+    def timed_save(*args, **kwargs):
+        began = time.perf_counter()
+        try:
+            return save(*args, **kwargs)
+        finally:
+            timings["excel_write"] += time.perf_counter() - began
+    sheetOPS.saveToFile = timed_save
+
+    githubOPS = githubManipulations(template=template)
+    if tokens > 1:
+        auth = githubOPS.authenticate_pool(tokens=os.environ["GITHUB_TOKENS"].split(","), pool_size=workers,
+                                           throttle=False, response_cache=True)
+    else:
+        auth = githubOPS.authenticate_github(pool_size=workers, throttle=False, response_cache=True)
+    index = repositoryIndex(auth=auth)
+    index.refresh(auth)
+    state = runStateStore(workbook)
+    state.reset()
+
+    builder = None
+    if build_push:
+        # Content goes to local bare repositories; the fake API only creates the empty repos
+        tmp = os.path.dirname(workbook)
+        builder = localRepositoryBuilder(os.path.join(tmp, "build"), workers=workers,
+                                         remote_url=os.path.join(tmp, "remotes", "{name}.git"))
+
+    began = time.perf_counter()
+    engine = provisioningEngine(githubOPS, auth, sheetOPS, workers=workers, index=index, state=state,
+                                report_every=10 ** 9, backend=backend, builder=builder)
+    summary = engine.run(rows, render=sheetOPS.generate_readme_simulations)
+    timings["provision"] = time.perf_counter() - began
+    timings["build"] = builder.build_seconds if builder else 0.0
+
+    began = time.perf_counter()
+    githubOPS.list_repositories(auth)
+    timings["list"] = time.perf_counter() - began
+
+    return dict(summary=summary, timings=timings,
+                peak_rss_mb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+
+
+def bench(rows, provision_limit=1000, workers=4, latency=0.02, rate_limit_every=0, backend="sync", build_push=False,
+          template=False, tokens=1, quota=5000, window=3600):
+    """Benchmark one workbook size and return its metrics."""
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        workbook = make_workbook(os.path.join(tmp, f"bench_{rows}.xlsx"), rows)
+        generate_time = time.perf_counter() - started
+
+        server = fakeGitHub(latency=latency, rate_limit_every=rate_limit_every, quota=quota, window=window)
+        base_url = server.start()
+        if template:
+            server.add_template("scaffold", TEMPLATE_FILES)
+        try:
+            results = multiprocessing.Queue()
+            child = multiprocessing.Process(target=_provision,
+                                            args=(workbook, base_url, provision_limit, workers, backend, build_push,
+                                                  f"{server.owner}/scaffold" if template else None, tokens, results))
+            child.start()
+            result = None
+            while result is None:
+                try:
+                    result = results.get(timeout=1.0)
+                except queue.Empty:
+                    if not child.is_alive():
+                        raise RuntimeError(f"Provisioning process exited with code {child.exitcode} "
+                                           f"before reporting a result")
+            child.join()
+        finally:
+            server.stop()
+    if "error" in result:
+        raise RuntimeError(f"Provisioning process failed for {rows} rows:\n{result['error']}")
+
+    provisioned = result["summary"]["created"]
+    timings = result["timings"]
+    calls = {route: count for route, count in server.requests.items()}
+    return {
+        "rows": rows,
+        "provisioned": provisioned,
+        "failed": result["summary"]["failed"],
+        "workbook_generate_s": round(generate_time, 3),
+        "excel_read_s": round(timings["excel_read"], 3),
+        "cached_read_s": round(timings["cached_read"], 3),
+        "excel_write_s": round(timings["excel_write"], 3),
+        "provision_s": round(timings["provision"], 3),
+        "build_s": round(timings["build"], 3),
+        "list_s": round(timings["list"], 3),
+        "repos_per_sec": round(provisioned / timings["provision"], 2) if timings["provision"] else 0.0,
+        "http_calls": server.total_requests(),
+        "http_calls_per_repo": round(server.total_requests() / provisioned, 2) if provisioned else None,
+        "peak_rss_mb": round(result["peak_rss_mb"], 1),
+        "calls_by_route": calls,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the provisioning flow against a fake GitHub API.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 1000],
+                        help="workbook sizes to generate (e.g. 10 1000 100000)")
+    parser.add_argument("--provision-limit", type=int, default=1000,
+                        help="provision at most this many rows of each workbook")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every API response")
+    parser.add_argument("--rate-limit-every", type=int, default=0,
+                        help="answer every Nth write with a secondary rate limit")
+    parser.add_argument("--backend", choices=("sync", "async"), default="sync",
+                        help="provision through PyGithub threads or the aiohttp event loop")
+    parser.add_argument("--build-push", action="store_true",
+                        help="build local git repositories offline and push them to local bare remotes")
+    parser.add_argument("--template", action="store_true",
+                        help="generate every repository from a template repository holding a scaffold")
+    parser.add_argument("--tokens", type=int, default=1,
+                        help="provision through a credential pool of this many tokens")
+    parser.add_argument("--quota", type=int, default=5000, help="requests per token and window")
+    parser.add_argument("--window", type=int, default=3600, help="seconds until a token's quota resets")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+    header = (f"{'rows':>8} {'repos/s':>8} {'calls/repo':>10} {'read s':>8} {'cached s':>8} {'write s':>8} "
+              f"{'list s':>7} {'RSS MB':>7}")
+    print(header)
+    for rows in args.rows:
+        result = bench(rows, args.provision_limit, args.workers, args.latency, args.rate_limit_every, args.backend,
+                       args.build_push, args.template, args.tokens, args.quota, args.window)
+        results.append(result)
+        print(f"{result['rows']:>8} {result['repos_per_sec']:>8} {str(result['http_calls_per_repo']):>10} "
+              f"{result['excel_read_s']:>8} {result['cached_read_s']:>8} {result['excel_write_s']:>8} {result['list_s']:>7} "
+              f"{result['peak_rss_mb']:>7}")
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Run instrumentation
+-------------------
+Records, per githubManipulations / stylesheetManipulations operation, a latency
+histogram, error and retry counts, and the HTTP requests (count, status, bytes
+sent) made while the operation was running. Results are exported as JSON or
+Prometheus text, and optionally as a Chrome trace file (open it in
+chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import functools, json, os, threading, time
+from contextlib import contextmanager
+
+# Prometheus-style latency buckets, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf"))
+
+# Metrics objects that receive HTTP events from the patched PyGithub requester
+_active = []
+_installed = False
+_install_lock = threading.Lock()
+
+
+class operationStats(object):
+    __slots__ = ("count", "errors", "retries", "total", "max", "buckets", "http_requests", "http_errors",
+                 "bytes_sent", "http_by_verb")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.http_requests = 0
+        self.http_errors = 0
+        self.bytes_sent = 0
+        self.http_by_verb = {}
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def as_dict(self):
+        cumulative, running = {}, 0
+        for bound, count in zip(BUCKETS, self.buckets):
+            running += count
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = running
+        return {
+            "count": self.count, "errors": self.errors, "retries": self.retries,
+            "seconds_total": round(self.total, 6), "seconds_max": round(self.max, 6),
+            "seconds_mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "histogram": cumulative,
+            "http_requests": self.http_requests, "http_errors": self.http_errors,
+            "http_by_verb": dict(self.http_by_verb), "bytes_sent": self.bytes_sent,
+        }
+
+
+class operationMetrics(object):
+    """
+    Collect per-operation metrics for a run.
+
+    Usage:
+        metrics = operationMetrics(trace=True)
+        metrics.instrument(githubOPS)
+        metrics.instrument(sheetOPS)
+        metrics.instrument_http()
+        ...
+        metrics.write_json("metrics.json")
+    """
+    def __init__(self, trace=False):
+        self.stats = {}
+        self.trace = trace
+        self.spans = []
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    # -- recording --------------------------------------------------------
+
+    def _stats(self, name):
+        stats = self.stats.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self.stats.setdefault(name, operationStats())
+        return stats
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current(self):
+        """Name of the innermost operation running on this thread."""
+        stack = self._stack()
+        return stack[-1] if stack else "unattributed"
+
+    def _span(self, name, began, seconds, category, args=None):
+        if self.trace:
+            event = {"name": name, "cat": category, "ph": "X", "pid": os.getpid(),
+                     "tid": threading.get_ident(), "ts": round((began - self.started) * 1e6),
+                     "dur": round(seconds * 1e6)}
+            if args:
+                event["args"] = args
+            with self._lock:
+                self.spans.append(event)
+
+    @contextmanager
+    def span(self, name):
+        """Time a block of code as the operation `name`."""
+        stack = self._stack()
+        stack.append(name)
+        began = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            seconds = time.perf_counter() - began
+            stack.pop()
+            stats = self._stats(name)
+            with self._lock:
+                stats.observe(seconds)
+                if failed:
+                    stats.errors += 1
+            self._span(name, began, seconds, "operation")
+
+    def record_http(self, verb, url, status, bytes_sent, began, seconds):
+        stats = self._stats(self.current())
+        with self._lock:
+            stats.http_requests += 1
+            stats.http_by_verb[verb] = stats.http_by_verb.get(verb, 0) + 1
+            stats.bytes_sent += bytes_sent
+            if status is None or status >= 400:
+                stats.http_errors += 1
+        self._span(f"{verb} {url.split('?')[0]}", began, seconds, "http", {"status": status})
+
+    def record_http_retry(self, verb, url, status):
+        """
+        An attempt urllib3 retried on its own. PyGithub only sees the final attempt,
+        so these are counted here, once each; rate limits left to the scheduler are
+        counted by instrument_scheduler() instead.
+        """
+        stats = self._stats(self.current())
+        with self._lock:
+            stats.http_requests += 1
+            stats.http_by_verb[verb] = stats.http_by_verb.get(verb, 0) + 1
+            if status is None or status >= 400:
+                stats.http_errors += 1
+                stats.retries += 1
+        now = time.perf_counter()
+        self._span(f"{verb} {(url or '').split('?')[0]}", now, 0.0, "http", {"status": status, "retried": True})
+
+    def record_retry(self):
+        stats = self._stats(self.current())
+        with self._lock:
+            stats.retries += 1
+
+    # -- wiring -----------------------------------------------------------
+
+    def instrument(self, obj, methods=None, prefix=None):
+        """
+        Wrap the public methods of an object so each call is recorded.
+
+        Args:
+            obj: githubManipulations, stylesheetManipulations or any other instance
+            methods (list): Method names to wrap, defaults to every public method
+            prefix (str): Operation name prefix, defaults to the class name
+
+        Returns:
+            The same object, instrumented in place
+        """
+        prefix = prefix or type(obj).__name__
+        if methods is None:
+            methods = [name for name in dir(type(obj))
+                       if not name.startswith("_") and callable(getattr(type(obj), name, None))]
+        for name in methods:
+            method = getattr(obj, name)
+            setattr(obj, name, self._wrap(f"{prefix}.{name}", method))
+        return obj
+
+    def _wrap(self, name, method):
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            with self.span(name):
+                return method(*args, **kwargs)
+        return timed
+
+    def instrument_scheduler(self, scheduler):
+        """Count rate limit back-offs against the operation that hit them."""
+        backoff = scheduler.backoff
+
+        def counted(delay, shared=True):
+            self.record_retry()
+            return backoff(delay, shared)
+        scheduler.backoff = counted
+        return scheduler
+
+    def instrument_http(self):
+        """Record every HTTP request PyGithub sends while this object is active."""
+        install_http_hook()
+        with _install_lock:
+            if self not in _active:
+                _active.append(self)
+        return self
+
+    def close(self):
+        with _install_lock:
+            if self in _active:
+                _active.remove(self)
+
+    # -- export -----------------------------------------------------------
+
+    def summary(self):
+        with self._lock:
+            operations = {name: stats.as_dict() for name, stats in sorted(self.stats.items())}
+        return {
+            "elapsed_seconds": round(time.perf_counter() - self.started, 3),
+            "http_requests": sum(op["http_requests"] for op in operations.values()),
+            "operations": operations,
+        }
+
+    def to_prometheus(self):
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# TYPE autogitrepo_operation_duration_seconds histogram",
+        ]
+        summary = self.summary()["operations"]
+        for name, op in summary.items():
+            label = f'operation="{name}"'
+            for bound, count in op["histogram"].items():
+                lines.append(f'autogitrepo_operation_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(f"autogitrepo_operation_duration_seconds_sum{{{label}}} {op['seconds_total']}")
+            lines.append(f"autogitrepo_operation_duration_seconds_count{{{label}}} {op['count']}")
+        for metric, key, kind in (("autogitrepo_operation_errors_total", "errors", "counter"),
+                                  ("autogitrepo_retries_total", "retries", "counter"),
+                                  ("autogitrepo_http_errors_total", "http_errors", "counter"),
+                                  ("autogitrepo_http_bytes_sent_total", "bytes_sent", "counter")):
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, op in summary.items():
+                lines.append(f'{metric}{{operation="{name}"}} {op[key]}')
+        lines.append("# TYPE autogitrepo_http_requests_total counter")
+        for name, op in summary.items():
+            for verb, count in sorted(op["http_by_verb"].items()):
+                lines.append(f'autogitrepo_http_requests_total{{operation="{name}",verb="{verb}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path):
+        with open(path, "w") as output:
+            json.dump(self.summary(), output, indent=2)
+        return path
+
+    def write_prometheus(self, path):
+        with open(path, "w") as output:
+            output.write(self.to_prometheus())
+        return path
+
+    def write_trace(self, path):
+        """Write the recorded spans in the Chrome trace event format."""
+        with self._lock:
+            events = list(self.spans)
+        with open(path, "w") as output:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, output)
+        return path
+
+    def report(self):
+        """Print a one-line-per-operation summary, slowest total first."""
+        operations = self.summary()["operations"]
+        print(f"{'operation':<50} {'calls':>6} {'total s':>9} {'mean s':>8} {'http':>6} {'retries':>7}")
+        for name, op in sorted(operations.items(), key=lambda item: -item[1]["seconds_total"]):
+            print(f"{name:<50} {op['count']:>6} {op['seconds_total']:>9.3f} {op['seconds_mean']:>8.3f} "
+                  f"{op['http_requests']:>6} {op['retries']:>7}")
+
+
+def install_http_hook():
+    """
+    Patch PyGithub's Requester once so every raw HTTP request is reported to the
+    active metrics objects. Requester copies made by PyGithub (lazy/auth variants)
+    share the class, so nothing escapes.
+
+    The Requester only sees the last attempt of a request urllib3 retried, so
+    urllib3's Retry.increment() (which GithubRetry ends in too) is patched as well
+    and reports every attempt it retries.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from github.Requester import Requester
+        raw = Requester._Requester__requestRaw
+
+        @functools.wraps(raw)
+        def counted(self, cnx, verb, url, requestHeaders, input, *args, **kwargs):
+            if not _active:
+                return raw(self, cnx, verb, url, requestHeaders, input, *args, **kwargs)
+            began = time.perf_counter()
+            status = None
+            try:
+                result = raw(self, cnx, verb, url, requestHeaders, input, *args, **kwargs)
+                status = result[0]
+                return result
+            finally:
+                seconds = time.perf_counter() - began
+                sent = len(input) if isinstance(input, (str, bytes)) else 0
+                for metrics in list(_active):
+                    metrics.record_http(verb, url, status, sent, began, seconds)
+
+        Requester._Requester__requestRaw = counted
+        _install_retry_hook()
+        _installed = True
+
+
+def _install_retry_hook():
+    from urllib3.util.retry import Retry
+    increment = Retry.increment
+
+    @functools.wraps(increment)
+    def counted(self, method=None, url=None, response=None, *args, **kwargs):
+        # Raises once retries are exhausted: that last attempt reaches the Requester
+        retry = increment(self, method, url, response, *args, **kwargs)
+        if _active:
+            status = getattr(response, "status", None)
+            for metrics in list(_active):
+                metrics.record_http_retry(method, url, status)
+        return retry
+
+    Retry.increment = counted
@@ -1,53 +1,353 @@
-import time
-from logic import githubManipulations, stylesheetManipulations
-
-#authenticate_github()
-#g = authenticate_github()
-#list_repositories(g)
-
-filename    = "input_files/test_formatted_modelling_computer_simulation.xlsx"
-sheetOPS    = stylesheetManipulations(filename)
-githubOPS   = githubManipulations()
-auth        = githubOPS.authenticate_github()
-
-table_columns   = sheetOPS.columnHeader()
-table_rows      = sheetOPS.tableRows()
-print("table_columns: ", table_columns, "\n")
-#print("table_rows: ", table_rows)
-
-#all_repo = githubOPS.list_repositories(auth)
-#this_repo = githubOPS.search_my_repositories(auth, "Loan-Approval-Expert-System")
-#print(this_repo)
-#for repo in this_repo:
-#    print(repo.name)
-#    print(repo.description)
-
-    
-
-for row in table_rows:
-    #print(type(row))
-    #print(row["No."])
-    #print(row["Setup Instructions"], "\n") #, type(row["Setup Instructions"]))
+"""
+Command line entry point
+------------------------
+    python main.py provision [workbook ...] [--resume] [--stream] [--backend async] [--build-dir DIR]
+                             [--owner ORG] [--metrics FILE ...]
+    python main.py watch     workbook [--interval SECONDS] [--new-only]
+    python main.py sync      [workbook ...]
+    python main.py audit     [workbook ...]
+    python main.py list      [--search NAME]
+    python main.py list      --live [--output FILE] [--fields name,html_url,...] [--match GLOB]
+                             [--visibility public|private] [--since TIME] [--owner ORG] [--write-back WORKBOOK]
+    python main.py render    [workbook ...] [--output-dir DIR]
+    python main.py validate  [workbook ...] [--rejections FILE]
+
+A workbook argument may also be a directory or a glob ("catalogues/*.xlsx");
+several workbooks, or a directory/glob, are read as one catalogue covering
+every sheet of every workbook.
+
+Credentials come from the environment: GITHUB_TOKEN (or GITHUB_USERNAME and
+GITHUB_PASSWORD). Setting GITHUB_TOKENS (several tokens) or GITHUB_APP_ID,
+GITHUB_APP_PRIVATE_KEY and optionally GITHUB_APP_INSTALLATION_IDS spreads the
+work over a pool of credentials instead.
+
+Only argparse is imported up front; each subcommand imports what it needs, so
+`--help` and the commands that never touch a workbook (or the API) start fast.
+Running without a subcommand (`python main.py workbook.xlsx --resume`) still
+provisions, and the old `--audit` / `--sync` flags still select those commands.
+"""
+
+import argparse, sys
+
+DEFAULT_WORKBOOK = "input_files/test_formatted_modelling_computer_simulation.xlsx"
+COMMANDS = ("provision", "watch", "sync", "audit", "list", "render", "validate")
+WORKERS = 4     # concurrent rows; pacing is left to the rate limit scheduler
+ASYNC_WORKERS = 32  # concurrent requests on the async backend, they cost no thread each
+
+
+def _metrics(args):
+    if not (args.metrics or args.prometheus or args.trace):
+        return None
+    from instrumentation import operationMetrics
+    return operationMetrics(trace=bool(args.trace)).instrument_http()
+
+
+def _report(metrics, args):
+    if not metrics:
+        return
+    metrics.report()
+    if args.metrics:
+        metrics.write_json(args.metrics)
+    if args.prometheus:
+        metrics.write_prometheus(args.prometheus)
+    if args.trace:
+        metrics.write_trace(args.trace)
+
+
+def _workbooks(args):
+    """A stylesheetManipulations for one workbook file, else a workbookCatalogue."""
+    import glob, os
+    from logic import stylesheetManipulations, workbookCatalogue
+    sources = args.sources or [DEFAULT_WORKBOOK]
+    if len(sources) == 1 and not os.path.isdir(sources[0]) and not glob.has_magic(sources[0]):
+        return stylesheetManipulations(sources[0], stream=getattr(args, "stream", False))
+    catalogue = workbookCatalogue(sources)
+    for name, source, first in catalogue.duplicates:
+        print(f"duplicate: {name} in {source[0]} [{source[1]}], first seen in {first[0]} [{first[1]}]")
+    return catalogue
+
+
+def _authenticate(githubOPS, **options):
+    # One Github object, or a credentialPool when several credentials are configured
+    import os
+    if os.environ.get("GITHUB_TOKENS") or os.environ.get("GITHUB_APP_ID"):
+        return githubOPS.authenticate_pool(**options)
+    return githubOPS.authenticate_github(**options)
+
+
+def _session(args, metrics=None, scheduled=True):
+    """
+    Read the workbooks and open an authenticated, indexed GitHub session.
+
+    `scheduled` sessions leave rate limits to the rateLimitScheduler of a
+    provisioningEngine; the others let PyGithub retry them.
+    """
+    from contextlib import nullcontext
+    from logic import githubManipulations, repositoryIndex
+
+    with metrics.span("stylesheetManipulations.read_excel") if metrics else nullcontext():
+        sheetOPS    = _workbooks(args)
+    githubOPS   = githubManipulations(template=getattr(args, "template", None))
+    if metrics:
+        metrics.instrument(sheetOPS)
+        metrics.instrument(githubOPS)
+    # One pooled connection per worker thread, so --workers never waits on the pool
+    auth        = _authenticate(githubOPS, pool_size=getattr(args, "workers", None) or WORKERS, throttle=False,
+                                response_cache=True, retry_rate_limits=not scheduled)
+    index       = repositoryIndex(owner=getattr(args, "owner", None), auth=auth)
+    if metrics:
+        metrics.instrument(index)
+    index.refresh(auth)
+    print("table_columns: ", sheetOPS.columnHeader(), "\n")
+    return sheetOPS, githubOPS, auth, index
+
+
+def _preflight(args, sheetOPS, index=None, state=None):
+    """Rows that pass the pre-flight checks; the rejections are printed and optionally saved."""
+    from logic import rowPreflight
+    check   = rowPreflight(index=index, state=state)
+    rows    = sheetOPS.validRows(check)
+    report  = check.report()
+    for _, rejected in report.iterrows():
+        print(f"rejected: {rejected['Source']} row {rejected['Row']}: {rejected['Assignment Title']}: "
+              f"{rejected['Reason']}")
+    print("preflight: ", check.summary())
+    if args.rejections:
+        check.write_report(args.rejections)
+    return rows
+
+
+def provision(args):
+    from logic import provisioningEngine, runStateStore
+    metrics = _metrics(args)
+    sheetOPS, githubOPS, auth, index = _session(args, metrics)
+    state       = runStateStore(sheetOPS.filename)
+    if not args.resume:
+        state.reset()
+    # Streaming never holds the whole sheet, so its rows skip the DataFrame pre-flight
+    rows        = sheetOPS.tableRows() if args.stream else _preflight(args, sheetOPS, index, state)
+    workers     = args.workers or (ASYNC_WORKERS if args.backend == "async" else WORKERS)
+    builder     = None
+    if args.build_dir:
+        from logic import localRepositoryBuilder, DEFAULT_REMOTE_URL
+        builder = localRepositoryBuilder(args.build_dir, remote_url=args.remote_url or DEFAULT_REMOTE_URL)
+    engine      = provisioningEngine(githubOPS, auth, sheetOPS, workers=workers, index=index, state=state,
+                                     backend=args.backend, builder=builder, owner=args.owner)
+    if metrics:
+        metrics.instrument_scheduler(engine.scheduler)
+    engine.run(rows, render=sheetOPS.generate_readme_simulations)
+    print("row states: ", state.summary())
+    if engine.pool is not None:
+        print("credentials: ", engine.pool.stats())
+    _report(metrics, args)
+
+
+def watch(args):
+    import glob, os
+    from logic import workbookWatcher, runStateStore
+    if len(args.sources) > 1 or (args.sources and (os.path.isdir(args.sources[0]) or glob.has_magic(args.sources[0]))):
+        raise SystemExit("watch takes a single workbook file")
+    metrics = _metrics(args)
+    sheetOPS, githubOPS, auth, index = _session(args, metrics)
+    # Never reset: rows completed before the watch started stay done
+    state       = runStateStore(sheetOPS.filename)
+    watcher     = workbookWatcher(sheetOPS.filename, githubOPS, auth, index=index, state=state, interval=args.interval,
+                                  workers=args.workers or WORKERS, owner=args.owner, baseline=args.new_only)
+    if metrics:
+        metrics.instrument_scheduler(watcher.scheduler)
+    print(f"Watching {sheetOPS.filename} every {args.interval}s, Ctrl-C to stop")
+    watcher.process(sheetOPS)
+    print("watch: ", watcher.run())
+    _report(metrics, args)
+
+
+def sync(args):
+    metrics = _metrics(args)
+    sheetOPS, githubOPS, auth, index = _session(args, metrics, scheduled=False)
+    summary = githubOPS.sync_readmes(auth, sheetOPS.tableRows(), sheetOPS.generate_readme_simulations, index,
+                                     workers=WORKERS)
+    print("sync: ", summary)
+    _report(metrics, args)
+
+
+def audit(args):
+    metrics = _metrics(args)
+    sheetOPS, githubOPS, auth, index = _session(args, metrics, scheduled=False)
+    report  = githubOPS.audit_repositories(auth, sheetOPS.tableRows(), render=sheetOPS.generate_readme_simulations,
+                                           index=index)
+    for title, status in report.items():
+        if status != "ok":
+            print(f"{status:>10}: {title}")
+    print("audit: ", {status: list(report.values()).count(status) for status in set(report.values())})
+    _report(metrics, args)
+
+
+def list_live(args):
+    # Streams from the API, pages in parallel; pandas only for --write-back
+    from logic import githubManipulations, open_sink, sheetColumnSink, stylesheetManipulations
+    fields      = tuple(field.strip() for field in args.fields.split(",") if field.strip())
+    if args.write_back:
+        fields  = tuple(dict.fromkeys(fields + ("name", "html_url")))
+    githubOPS   = githubManipulations()
+    auth        = githubOPS.authenticate_github(pool_size=args.workers)
+    sinks       = []
+    if args.output:
+        sinks.append(open_sink(args.output, fields))
+    if args.write_back:
+        sinks.append(sheetColumnSink(stylesheetManipulations(args.write_back)))
+    listed      = 0
     try:
-        title = row["Assignment Title"]#.replace("Expert ", "")
-        #title = title.replace(" System", "")
-        description = row["Objective"]
-        #print(title)
-        #print("row: ", row)
-        readme = sheetOPS.generate_readme_simulations(row)
-        #print("readme: ", type(readme), readme)
-        createRepo = githubOPS.create_new_repository(auth, title, description, readme, filename)
-
-    except:
-        pass
-    for column in table_columns:
-        #createRepo = githubOPS.create_new_repository(auth, row["Assignment Title"])
-        #print(column, ": ", row[column], "\n")
-        pass
-    time.sleep(2)
-
-
-#repo_list = githubOPS.list_repositories(auth)
-#print(repo_list)
-#print(auth)#.get_user("imosudi"));# time.sleep(300)
-#createRepo = githubOPS.create_new_repository(auth,"test assignment")
\ No newline at end of file
+        for item in githubOPS.iter_repositories(auth, owner=args.owner, fields=fields, pattern=args.match,
+                                                visibility=args.visibility, since=args.since, workers=args.workers):
+            listed += 1
+            if not sinks:
+                print("\t".join("" if item[field] is None else str(item[field]) for field in fields))
+            for sink in sinks:
+                sink.write(item)
+    finally:
+        for sink in sinks:
+            sink.close()
+    if sinks:
+        print(f"listed {listed} repositories", *(f"{type(sink).__name__}: {sink.count}" for sink in sinks))
+
+
+def list_repositories(args):
+    # Needs PyGithub but never pandas
+    from logic import githubManipulations, repositoryIndex
+    if args.live or args.output or args.write_back or args.match or args.visibility or args.since or args.owner:
+        return list_live(args)
+    githubOPS   = githubManipulations()
+    auth        = githubOPS.authenticate_github(response_cache=True)
+    index       = repositoryIndex(auth=auth)
+    if args.search:
+        index.refresh(auth)
+        for repo in githubOPS.search_my_repositories(auth, args.search, index=index):
+            print(f"{repo.name} {repo.html_url}")
+        return
+    for item in githubOPS.list_repositories(auth, index=index):
+        for name, html_url in item.items():
+            print(f"{name} {html_url}")
+
+
+def render(args):
+    # Needs pandas but never PyGithub
+    import os
+    from logic import repo_slug
+    sheetOPS    = _workbooks(args)
+    rows        = sheetOPS.tableRows()
+    readmes     = sheetOPS.render_all(rows)
+    for row, readme in zip(rows, readmes):
+        if not args.output_dir:
+            print(readme)
+            continue
+        folder = os.path.join(args.output_dir, repo_slug(str(row.get("Assignment Title") or "untitled")))
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, "README.md"), "w") as output:
+            output.write(readme)
+    if args.output_dir:
+        print(f"rendered {len(readmes)} README files into {args.output_dir}")
+
+
+def validate(args):
+    # Checks against the local repository index only, no API calls
+    from logic import repositoryIndex
+    _preflight(args, _workbooks(args), repositoryIndex())
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Create a GitHub repository for every row of a workbook.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def workbook_command(name, handler, help):
+        command = commands.add_parser(name, help=help)
+        command.add_argument("sources", nargs="*", metavar="workbook",
+                             help=f"workbook file, directory or glob (default: {DEFAULT_WORKBOOK})")
+        command.set_defaults(handler=handler)
+        return command
+
+    def run_flags(command, stream=True):
+        if stream:
+            command.add_argument("--stream", action="store_true", help="read rows lazily instead of loading the whole workbook (single workbook only)")
+        command.add_argument("--metrics", help="write per-operation latency/HTTP metrics as JSON to this file")
+        command.add_argument("--prometheus", help="write the same metrics in Prometheus text format to this file")
+        command.add_argument("--trace", help="write a Chrome trace of every operation and HTTP request to this file")
+
+    command = workbook_command("provision", provision, "create a repository for every row")
+    command.add_argument("--resume", action="store_true", help="replay only the rows whose steps did not complete")
+    command.add_argument("--backend", choices=("sync", "async"), default="sync",
+                         help="PyGithub on a thread pool, or aiohttp on one event loop (needs aiohttp)")
+    command.add_argument("--rejections", help="write the rows rejected by the pre-flight checks to this .csv/.xlsx")
+    command.add_argument("--template", metavar="OWNER/NAME",
+                         help="generate each repository from this template repository, then overwrite its README")
+    command.add_argument("--build-dir", help="build every repository as a local git repository here first, "
+                                             "then push each one with a single git push")
+    command.add_argument("--remote-url", help="push URL template with {owner} and {name} "
+                                              "(default https://github.com/{owner}/{name}.git)")
+    command.add_argument("--workers", type=int,
+                         help=f"concurrent rows (default {WORKERS}, or {ASYNC_WORKERS} with --backend async)")
+    command.add_argument("--owner", metavar="ORG",
+                         help="create the repositories in this organisation instead of the authenticated account")
+    run_flags(command)
+
+    command = workbook_command("watch", watch, "stay running and provision the rows added each time the workbook is saved")
+    command.add_argument("--interval", type=float, default=1.0, help="seconds between checks of the workbook")
+    command.add_argument("--new-only", action="store_true",
+                         help="only provision rows added after the watch starts, not the pending rows already there")
+    command.add_argument("--template", metavar="OWNER/NAME", help="as for provision")
+    command.add_argument("--owner", metavar="ORG", help="as for provision")
+    command.add_argument("--workers", type=int, help=f"concurrent rows per change (default {WORKERS})")
+    run_flags(command, stream=False)
+
+    command = workbook_command("sync", sync, "push README changes for existing repositories instead of creating any")
+    run_flags(command)
+
+    command = workbook_command("audit", audit,
+                               "check every row's repository and README with batched GraphQL reads")
+    run_flags(command)
+
+    command = commands.add_parser("list", help="list your repositories from the local index, or live from the API")
+    command.add_argument("--search", help="only show the repository with this name")
+    command.add_argument("--live", action="store_true",
+                         help="list from the API, fetching the pages in parallel (implied by the options below)")
+    command.add_argument("--output", help="write the listing to this .jsonl, .csv or .sqlite file")
+    command.add_argument("--fields", default="name,html_url",
+                         help="comma separated fields to keep, dotted for nested ones (e.g. owner.login)")
+    command.add_argument("--match", metavar="GLOB", help="only repositories whose name matches this pattern")
+    command.add_argument("--visibility", choices=("public", "private", "all"))
+    command.add_argument("--since", metavar="TIME", help="only repositories updated after this ISO 8601 time")
+    command.add_argument("--owner", metavar="ORG", help="list this organisation's repositories")
+    command.add_argument("--write-back", metavar="WORKBOOK",
+                         help="write each listed repository's URL into the GitHub column of this workbook")
+    command.add_argument("--workers", type=int, default=8, help="pages fetched concurrently (default 8)")
+    command.set_defaults(handler=list_repositories)
+
+    command = workbook_command("render", render, "render every row's README without calling GitHub")
+    command.add_argument("--output-dir", help="write <dir>/<repository>/README.md instead of printing")
+
+    command = workbook_command("validate", validate, "run the pre-flight checks only, against the local index")
+    command.add_argument("--rejections", help="write the rejected rows to this .csv/.xlsx file")
+    return parser
+
+
+def _legacy(argv):
+    # `main.py [workbook] [--resume] [--audit|--sync] ...` from before the subcommands
+    if argv and (argv[0] in COMMANDS or argv[0] in ("-h", "--help")):
+        return argv
+    argv = list(argv)
+    command = "provision"
+    for flag in ("--audit", "--sync"):
+        if flag in argv:
+            argv.remove(flag)
+            command = flag[2:]
+    if command != "provision" and "--resume" in argv:
+        argv.remove("--resume")
+    return [command] + argv
+
+
+def main(argv=None):
+    args = build_parser().parse_args(_legacy(sys.argv[1:] if argv is None else argv))
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
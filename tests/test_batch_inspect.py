@@ -0,0 +1,65 @@
+"""
+batch_inspect only reports a repository as missing when GitHub says NOT_FOUND for it.
+"""
+
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import github
+import pytest
+
+from fake_github import fakeGitHub
+from logic import githubManipulations
+
+
+class cannedRequester(object):
+    graphql_url = "/graphql"
+
+    def __init__(self, response):
+        self.response = response
+
+    def requestJsonAndCheck(self, verb, url, input=None):
+        return {}, self.response
+
+
+class cannedAuth(object):
+    def __init__(self, response):
+        self.requester = cannedRequester(response)
+
+
+def test_missing_and_existing_repositories(monkeypatch, tmp_path):
+    server = fakeGitHub()
+    monkeypatch.setenv("GITHUB_API_URL", server.start())
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    try:
+        server.add_repos(1)
+        githubOPS = githubManipulations()
+        auth = githubOPS.authenticate_github(throttle=False)
+        name = next(iter(server.repos.values()))["name"]
+        found = githubOPS.batch_inspect(auth, [name, "Not There"])
+    finally:
+        server.stop()
+    assert found[name]["exists"] is True
+    assert found["Not There"]["exists"] is False
+
+
+def test_partial_errors_raise_instead_of_reporting_missing():
+    response = {
+        "data": {"r0": None, "r1": None},
+        "errors": [
+            {"type": "NOT_FOUND", "path": ["r0"], "message": "Could not resolve to a Repository"},
+            {"type": "FORBIDDEN", "path": ["r1"], "message": "Resource not accessible by integration"},
+        ],
+    }
+    with pytest.raises(github.GithubException, match="Resource not accessible"):
+        githubManipulations().batch_inspect(cannedAuth(response), ["a", "b"], owner="bench")
+
+
+def test_response_without_data_raises():
+    response = {"data": None, "errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]}
+    with pytest.raises(github.GithubException, match="rate limit"):
+        githubManipulations().batch_inspect(cannedAuth(response), ["a"], owner="bench")
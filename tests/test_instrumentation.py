@@ -0,0 +1,53 @@
+"""
+Every HTTP attempt, retried by urllib3 or not, is counted once, and every
+rate limit retry is counted once.
+"""
+
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pytest
+
+from fake_github import fakeGitHub
+from run_benchmarks import make_workbook
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    api = fakeGitHub(rate_limit_every=4, retry_after=0)
+    monkeypatch.setenv("GITHUB_API_URL", api.start())
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    yield api
+    api.stop()
+
+
+@pytest.mark.parametrize("retry_rate_limits", [False, True])
+def test_http_attempts_and_retries_are_counted_once(server, tmp_path, retry_rate_limits):
+    from instrumentation import operationMetrics
+    from logic import githubManipulations, stylesheetManipulations, provisioningEngine, rateLimitScheduler
+
+    workbook = make_workbook(str(tmp_path / "rows.xlsx"), 20)
+    metrics = operationMetrics().instrument_http()
+    try:
+        githubOPS = metrics.instrument(githubManipulations())
+        auth = githubOPS.authenticate_github(pool_size=4, throttle=False, retry_rate_limits=retry_rate_limits)
+        sheetOPS = stylesheetManipulations(workbook)
+        # One worker, so a retried write never lands on the server's next rate limit
+        engine = provisioningEngine(githubOPS, auth, sheetOPS, workers=1, report_every=100,
+                                    scheduler=rateLimitScheduler(auth, max_interval=0.05))
+        metrics.instrument_scheduler(engine.scheduler)
+        summary = engine.run(sheetOPS.tableRows())
+    finally:
+        metrics.close()
+
+    assert summary["failed"] == 0
+    operations = metrics.summary()["operations"].values()
+    rate_limited = server.writes // server.rate_limit_every
+    assert rate_limited > 0
+    assert sum(op["http_requests"] for op in operations) == server.total_requests()
+    assert sum(op["http_errors"] for op in operations) >= rate_limited
+    assert sum(op["retries"] for op in operations) == rate_limited
@@ -0,0 +1,33 @@
+"""
+Only absolute paths and file:// remotes are initialised locally before a push.
+"""
+
+import os, subprocess, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from logic import localRepositoryBuilder
+
+
+def test_file_remote_is_created_and_pushed(tmp_path):
+    builder = localRepositoryBuilder(str(tmp_path / "build"), remote_url=f"file://{tmp_path}/remotes/{{name}}.git",
+                                     token="")
+    builder.build_repository("Queue Model", "# Queue Model\n")
+    builder.push("Queue Model", attempts=1)
+    log = subprocess.run(["git", "--git-dir", str(tmp_path / "remotes" / "Queue-Model.git"), "log", "--oneline"],
+                         capture_output=True, text=True, check=True)
+    assert log.stdout.strip()
+
+
+def test_scp_style_remote_is_not_a_local_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GIT_SSH_COMMAND", "false")   # fail the push without reaching any host
+    builder = localRepositoryBuilder(str(tmp_path / "build"), remote_url="git@github.invalid:bench/{name}.git",
+                                     token="")
+    builder.build_repository("Queue Model", "# Queue Model\n")
+    with pytest.raises(RuntimeError):
+        builder.push("Queue Model", attempts=1)
+    assert sorted(os.listdir(tmp_path)) == ["build"]
+    assert sorted(os.listdir(tmp_path / "build")) == ["Queue-Model"]
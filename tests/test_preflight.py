@@ -0,0 +1,28 @@
+"""
+Pre-flight checks on sheets whose columns pandas reads as all-empty floats.
+"""
+
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from logic import rowPreflight
+
+
+def test_all_empty_title_column_rejects_every_row():
+    frame = pd.DataFrame({"Assignment Title": [np.nan, np.nan], "Objective": [np.nan, np.nan]})
+    accepted, report = rowPreflight().run(frame, source="empty.xlsx")
+    assert accepted.empty
+    assert list(report["Reason"]) == ["missing title", "missing title"]
+    assert list(report["Row"]) == [2, 3]
+
+
+def test_titles_are_trimmed_next_to_empty_cells():
+    frame = pd.DataFrame({"Assignment Title": ["  Queue   Model ", np.nan], "Objective": [np.nan, "x"]})
+    accepted, report = rowPreflight().run(frame)
+    assert list(accepted["Assignment Title"]) == ["Queue Model"]
+    assert list(accepted["Objective"]) == [""]
+    assert list(report["Reason"]) == ["missing title"]
@@ -0,0 +1,53 @@
+"""
+Rate limits must reach the provisioning engine: a client paced by a
+rateLimitScheduler may not retry 403/429 inside urllib3.
+"""
+
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pytest
+
+from fake_github import fakeGitHub
+from run_benchmarks import make_workbook
+
+
+@pytest.fixture
+def server(monkeypatch, tmp_path):
+    api = fakeGitHub(rate_limit_every=4, retry_after=0)
+    monkeypatch.setenv("GITHUB_API_URL", api.start())
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    yield api
+    api.stop()
+
+
+def test_secondary_rate_limits_back_off_through_the_scheduler(server, tmp_path):
+    from logic import githubManipulations, stylesheetManipulations, provisioningEngine, rateLimitScheduler
+
+    workbook = make_workbook(str(tmp_path / "rows.xlsx"), 20)
+    githubOPS = githubManipulations()
+    auth = githubOPS.authenticate_github(pool_size=4, throttle=False)
+    sheetOPS = stylesheetManipulations(workbook)
+    scheduler = rateLimitScheduler(auth, max_interval=0.05)
+    # One worker, so a retried write never lands on the server's next rate limit
+    engine = provisioningEngine(githubOPS, auth, sheetOPS, workers=1, scheduler=scheduler, report_every=100)
+
+    summary = engine.run(sheetOPS.tableRows())
+
+    assert scheduler.retries > 0
+    assert summary["retries"] == scheduler.retries
+    assert summary["failed"] == 0
+    assert summary["created"] + summary["existing"] == 20
+    # Every 403 the server sent was seen by the scheduler, none was retried by urllib3 on its own
+    assert scheduler.retries == server.writes // server.rate_limit_every
+
+
+def test_unscheduled_clients_keep_retrying_rate_limits(server):
+    from logic import githubManipulations
+
+    auth = githubManipulations().authenticate_github(throttle=False, retry_rate_limits=True)
+    assert auth.requester._Requester__retry.total == 10   # PyGithub's GithubRetry
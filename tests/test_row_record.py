@@ -0,0 +1,17 @@
+"""
+rowRecord reads like a read-only dict.
+"""
+
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic import row_type
+
+
+def test_row_record_reads_like_a_mapping():
+    row = row_type(["Assignment Title", "Objective"])(["Queue Model", None])
+    assert list(row.values()) == ["Queue Model", None]
+    assert dict(row) == {"Assignment Title": "Queue Model", "Objective": None}
+    assert row == {"Assignment Title": "Queue Model", "Objective": None}
+    assert row.get("Tasks", "") == ""
@@ -0,0 +1,41 @@
+"""
+Rows whose repository already exists are recorded as done, not failed.
+"""
+
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from fake_github import fakeGitHub
+from run_benchmarks import make_workbook
+
+
+def test_existing_repositories_are_done_on_resume(monkeypatch, tmp_path):
+    from logic import githubManipulations, stylesheetManipulations, provisioningEngine, runStateStore
+
+    server = fakeGitHub()
+    monkeypatch.setenv("GITHUB_API_URL", server.start())
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    workbook = make_workbook(str(tmp_path / "rows.xlsx"), 3)
+    try:
+        githubOPS = githubManipulations()
+        auth = githubOPS.authenticate_github(throttle=False)
+        githubOPS.get_user(auth).create_repo("Simulation-Assignment-1")
+        sheetOPS = stylesheetManipulations(workbook)
+        state = runStateStore(workbook)
+
+        first = provisioningEngine(githubOPS, auth, sheetOPS, workers=1, state=state, report_every=100)
+        summary = first.run(sheetOPS.tableRows())
+        assert (summary["created"], summary["existing"], summary["failed"]) == (2, 1, 0)
+        assert state.summary() == {"readme-pushed": 2, "existing": 1}
+
+        writes = server.writes
+        resumed = provisioningEngine(githubOPS, auth, sheetOPS, workers=1, state=state, report_every=100)
+        resumed.run(sheetOPS.tableRows())
+        assert resumed.skipped == 3
+        assert server.writes == writes
+    finally:
+        server.stop()
@@ -0,0 +1,43 @@
+"""
+seed_tree commits every file, and its blob payload cache stays bounded.
+"""
+
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import logic
+from fake_github import fakeGitHub
+from logic import githubManipulations
+
+
+def test_empty_repository_reports_every_file(monkeypatch, tmp_path, capsys):
+    server = fakeGitHub()
+    monkeypatch.setenv("GITHUB_API_URL", server.start())
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    try:
+        githubOPS = githubManipulations()
+        auth = githubOPS.authenticate_github(throttle=False)
+        repo = githubOPS.get_user(auth).create_repo("Queue-Model")
+        githubOPS.seed_tree(repo, {"README.md": "# Queue Model\n", "data/a.bin": b"\x00\xff\x01",
+                                   "data/b.bin": b"\xfe\x00\x02"})
+        files = server.repos["queue-model"]["files"]
+    finally:
+        server.stop()
+    # README.md creates the branch through the Contents API, the binaries follow as blobs
+    assert "Committed 3 files" in capsys.readouterr().out
+    assert "README.md" in files
+    assert server.requests["POST create_blob"] == 2
+
+
+def test_blob_payload_cache_drops_least_recently_used(monkeypatch):
+    monkeypatch.setattr(logic, "BLOB_PAYLOAD_CACHE_BYTES", 16)
+    monkeypatch.setattr(logic, "_blob_payloads", logic.collections.OrderedDict())
+    monkeypatch.setattr(logic, "_blob_payloads_size", 0)
+    for sha, content in (("a", b"\x00" * 6), ("b", b"\x01" * 6), ("c", b"\x02" * 6)):
+        logic.blob_payload(sha, content)   # 8 base64 characters each
+    assert list(logic._blob_payloads) == ["b", "c"]
+    assert logic._blob_payloads_size <= 16
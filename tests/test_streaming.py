@@ -0,0 +1,43 @@
+"""
+A streamed provisioning run leaves the workbook unparsed until its final write-back.
+"""
+
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pandas as pd
+
+from fake_github import fakeGitHub
+from run_benchmarks import make_workbook
+
+
+def test_streamed_run_keeps_frames_unloaded_until_the_end(monkeypatch, tmp_path):
+    from logic import githubManipulations, stylesheetManipulations, provisioningEngine
+
+    server = fakeGitHub()
+    monkeypatch.setenv("GITHUB_API_URL", server.start())
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    workbook = make_workbook(str(tmp_path / "rows.xlsx"), 60)   # past the journal's flush_every of 50
+    try:
+        githubOPS = githubManipulations()
+        auth = githubOPS.authenticate_github(throttle=False)
+        sheetOPS = stylesheetManipulations(workbook, stream=True)
+        unloaded = []
+        create = githubOPS.create_new_repository
+
+        def observed(*args, **kwargs):
+            unloaded.append(sheetOPS._df is None)
+            return create(*args, **kwargs)
+        githubOPS.create_new_repository = observed
+        summary = provisioningEngine(githubOPS, auth, sheetOPS, workers=2, report_every=1000).run(
+            sheetOPS.tableRows())
+    finally:
+        server.stop()
+
+    assert summary["created"] == 60
+    assert len(unloaded) == 60 and all(unloaded)
+    assert pd.read_excel(workbook)["GitHub"].notna().all()
@@ -0,0 +1,30 @@
+"""
+A workbook read from the cache matches a cold parse, also after a write-back.
+"""
+
+import os, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import pandas as pd
+
+from run_benchmarks import make_workbook
+
+
+def test_cached_sheets_match_a_cold_parse_after_save(tmp_path, monkeypatch):
+    from logic import stylesheetManipulations, workbookCache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    workbook = make_workbook(str(tmp_path / "rows.xlsx"), 3)
+    sheetOPS = stylesheetManipulations(workbook)
+    sheetOPS.updateGitHubColumns({"Simulation Assignment 1": "https://github.local/bench/Simulation-Assignment-1"})
+    sheetOPS.saveToFile()
+
+    stylesheetManipulations(workbook)   # parses the saved workbook once and caches it
+    cache = workbookCache()
+    cached = cache.get(workbook)
+    assert cache.hits == 1
+    for name, frame in pd.read_excel(workbook, sheet_name=None).items():
+        pd.testing.assert_frame_equal(cached[name], frame)
@@ -0,0 +1,44 @@
+"""
+GitHub URL write-backs reach workbooks whose GitHub column is still empty.
+"""
+
+import json, os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from logic import stylesheetManipulations
+
+
+def test_leftover_journal_fills_an_empty_github_column(tmp_path):
+    workbook = str(tmp_path / "rows.xlsx")
+    pd.DataFrame({"Assignment Title": ["Queue Model", "Ring Buffer"], "GitHub": [None, None]}).to_excel(
+        workbook, index=False)
+    with open(workbook + ".journal", "w", encoding="utf-8") as log:
+        log.write(json.dumps({"title": "Queue Model", "url": "https://github.local/bench/Queue-Model"}) + "\n")
+
+    sheetOPS = stylesheetManipulations(workbook, cache=False)
+    assert sheetOPS.firstSheet()["GitHub"].dtype == "float64"   # how pandas reads the empty column
+    sheetOPS.journal().record("Ring Buffer", "https://github.local/bench/Ring-Buffer")
+    sheetOPS.journal().flush()
+
+    assert not os.path.exists(workbook + ".journal")
+    assert pd.read_excel(workbook)["GitHub"].tolist() == ["https://github.local/bench/Queue-Model",
+                                                          "https://github.local/bench/Ring-Buffer"]
+
+
+def test_failed_replay_keeps_the_updates_pending(tmp_path, monkeypatch):
+    workbook = str(tmp_path / "rows.xlsx")
+    pd.DataFrame({"Assignment Title": ["Queue Model"]}).to_excel(workbook, index=False)
+    with open(workbook + ".journal", "w", encoding="utf-8") as log:
+        log.write(json.dumps({"title": "Queue Model", "url": "https://github.local/bench/Queue-Model"}) + "\n")
+
+    sheetOPS = stylesheetManipulations(workbook, cache=False)
+    def failing(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(sheetOPS, "saveToFile", failing)
+    journal = sheetOPS.journal()
+
+    assert journal.pending == {"Queue Model": "https://github.local/bench/Queue-Model"}
+    assert os.path.exists(workbook + ".journal")